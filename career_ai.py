@@ -1,10 +1,83 @@
 import os
+import copy
 import json
+import queue
 import re
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 
+# Built-in resource contents, used for any file missing from the resources directory
+_DEFAULT_RESOURCES = {
+    "job_search_tips.json": {
+        "resume_keywords": ["experienced", "skilled", "proficient", "managed", "led", "developed", "improved"],
+        "networking_tips": ["Attend industry events", "Connect with alumni", "Engage on LinkedIn", "Join professional groups"],
+        "job_boards": ["LinkedIn", "Indeed", "Glassdoor", "Monster", "Company websites", "Industry-specific boards"]
+    },
+    "interview_questions.json": {
+        "common_questions": [
+            "Tell me about yourself",
+            "Why are you interested in this position?",
+            "What are your strengths and weaknesses?",
+            "Describe a challenge you faced and how you overcame it",
+            "Where do you see yourself in 5 years?",
+            "Why should we hire you?"
+        ],
+        "technical_topics": {
+            "programming": ["Data structures", "Algorithms", "System design", "Problem-solving process"],
+            "project_management": ["Risk management", "Agile methodologies", "Stakeholder communication"],
+            "marketing": ["Campaign analytics", "SEO knowledge", "Social media strategy"]
+        }
+    },
+    "career_paths.json": {
+        "tech": ["Software Engineer", "Data Scientist", "Product Manager", "UX Designer", "DevOps Engineer"],
+        "business": ["Business Analyst", "Financial Analyst", "Management Consultant", "Marketing Specialist"],
+        "healthcare": ["Nurse", "Physician Assistant", "Health Informatics", "Healthcare Administrator"]
+    }
+}
+_RESOURCE_FILES = tuple(_DEFAULT_RESOURCES)
+
+# Achievement-oriented verbs looked for in resumes
+_ACHIEVEMENT_WORDS = frozenset({"achieved", "accomplishment", "improved", "increased", "decreased", "reduced", "saved", "delivered"})
+
+# Runs of word characters, i.e. the units delimited by regex \b boundaries
+_WORD_TOKEN_RE = re.compile(r'\w+')
+
+# Resumes with fewer whitespace-separated words than this are flagged as short
+_MIN_RESUME_WORDS = 200
+_WORD_RE = re.compile(r'\S+')
+
+# Interest/skill terms that trigger each career path category
+_CATEGORY_TRIGGERS = {
+    "tech": ("coding", "programming", "software", "computer", "technology", "data"),
+    "business": ("business", "finance", "management", "marketing", "sales"),
+    "healthcare": ("health", "medicine", "care", "patient", "biology"),
+}
+_TRIGGER_TO_CATEGORY = {term: category for category, terms in _CATEGORY_TRIGGERS.items() for term in terms}
+
+# One comma-separated term with surrounding whitespace excluded
+_TERM_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+# Job title fragments that select interview technical topics, in priority order
+_TITLE_CATEGORIES = (
+    ("programming", ("software", "developer", "engineer")),
+    ("project_management", ("project", "manager")),
+    ("marketing", ("market",)),
+)
+_TITLE_FRAGMENT_TO_CATEGORY = {fragment: category for category, fragments in _TITLE_CATEGORIES for fragment in fragments}
+_TITLE_RE = re.compile('|'.join(_TITLE_FRAGMENT_TO_CATEGORY))
+
+
+@lru_cache(maxsize=None)
+def _phrase_patterns(phrases):
+    """Compile (lowercased phrase, whole-word pattern) pairs for keyword phrases, shared by all agents."""
+    return tuple((phrase.lower(), re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)) for phrase in phrases)
+
+
 class CareerDevelopmentAgent:
     """AI agent for assisting with career development tasks."""
     
@@ -12,49 +85,49 @@ class CareerDevelopmentAgent:
         """Initialize the Career Development Agent with necessary resources."""
         self.user_profile = {}
         self.resources_path = "resources/"
+        self._paths = {name: os.path.join(self.resources_path, name) for name in _RESOURCE_FILES}
         self.load_resources()
         
     def load_resources(self):
-        """Load career development resources from files."""
+        """Load career development resources from files, falling back to built-in defaults."""
+        # Resources are static, so parse them once instead of on every request;
+        # the files are independent, so read them concurrently to overlap I/O
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            self._job_search, self._interview, self._career_paths = pool.map(self._load_resource, _RESOURCE_FILES)
+        
+        self._keywords = self._job_search["resume_keywords"]
+        # Single-word keywords are looked up in the resume's word set; only phrases
+        # or keywords with symbols need a regex, one per phrase so overlapping phrases all match
+        self._phrase_patterns = _phrase_patterns(tuple(k for k in self._keywords if not _WORD_TOKEN_RE.fullmatch(k)))
+        # Keywords account for 70 of the 100 score points
+        self._keyword_weight = 70.0 / len(self._keywords) if self._keywords else 0.0
+    
+    def export_resources(self):
+        """Write the built-in defaults for any missing resource files so they can be customized."""
         # Ensure resources directory exists
         os.makedirs(self.resources_path, exist_ok=True)
         
-        # Create default resources if they don't exist
-        self._ensure_resource_exists("job_search_tips.json", {
-            "resume_keywords": ["experienced", "skilled", "proficient", "managed", "led", "developed", "improved"],
-            "networking_tips": ["Attend industry events", "Connect with alumni", "Engage on LinkedIn", "Join professional groups"],
-            "job_boards": ["LinkedIn", "Indeed", "Glassdoor", "Monster", "Company websites", "Industry-specific boards"]
-        })
-        
-        self._ensure_resource_exists("interview_questions.json", {
-            "common_questions": [
-                "Tell me about yourself",
-                "Why are you interested in this position?",
-                "What are your strengths and weaknesses?",
-                "Describe a challenge you faced and how you overcame it",
-                "Where do you see yourself in 5 years?",
-                "Why should we hire you?"
-            ],
-            "technical_topics": {
-                "programming": ["Data structures", "Algorithms", "System design", "Problem-solving process"],
-                "project_management": ["Risk management", "Agile methodologies", "Stakeholder communication"],
-                "marketing": ["Campaign analytics", "SEO knowledge", "Social media strategy"]
-            }
-        })
+        # List the directory once rather than stat-ing each resource file
+        existing = set(os.listdir(self.resources_path))
         
-        self._ensure_resource_exists("career_paths.json", {
-            "tech": ["Software Engineer", "Data Scientist", "Product Manager", "UX Designer", "DevOps Engineer"],
-            "business": ["Business Analyst", "Financial Analyst", "Management Consultant", "Marketing Specialist"],
-            "healthcare": ["Nurse", "Physician Assistant", "Health Informatics", "Healthcare Administrator"]
-        })
+        for filename, default_content in _DEFAULT_RESOURCES.items():
+            self._ensure_resource_exists(existing, filename, default_content)
     
-    def _ensure_resource_exists(self, filename, default_content):
-        """Create resource file with default content if it doesn't exist."""
-        filepath = os.path.join(self.resources_path, filename)
-        if not os.path.exists(filepath):
-            with open(filepath, 'w') as f:
+    def _ensure_resource_exists(self, existing, filename, default_content):
+        """Create resource file with default content if it isn't among the existing files."""
+        if filename not in existing:
+            with open(self._paths[filename], 'w') as f:
                 json.dump(default_content, f, indent=4)
     
+    def _load_resource(self, filename):
+        """Read and parse a JSON resource file, or return its built-in default if missing."""
+        try:
+            with open(self._paths[filename], 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            # Copy so changes made through one agent never leak into the shared defaults
+            return copy.deepcopy(_DEFAULT_RESOURCES[filename])
+    
     def load_user_profile(self, filepath):
         """Load user profile from a JSON file."""
         try:
@@ -68,8 +141,9 @@ class CareerDevelopmentAgent:
     def save_user_profile(self, filepath):
         """Save current user profile to a JSON file."""
         try:
-            with open(filepath, 'w') as f:
-                json.dump(self.user_profile, f, indent=4)
+            # Compact output; json.dump already streams encoder chunks into the buffered file
+            with open(filepath, 'w', buffering=1 << 16) as f:
+                json.dump(self.user_profile, f, separators=(",", ":"))
             return True
         except Exception as e:
             print(f"Error saving profile: {e}")
@@ -81,10 +155,7 @@ class CareerDevelopmentAgent:
     
     def analyze_resume(self, resume_text):
         """Analyze a resume and provide improvement suggestions."""
-        with open(os.path.join(self.resources_path, "job_search_tips.json"), 'r') as f:
-            resources = json.load(f)
-        
-        keywords = resources["resume_keywords"]
+        keywords = self._keywords
         results = {
             "keyword_count": 0,
             "keywords_found": [],
@@ -92,37 +163,38 @@ class CareerDevelopmentAgent:
             "suggestions": []
         }
         
-        # Check for keywords
-        for keyword in keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', resume_text, re.IGNORECASE):
-                results["keyword_count"] += 1
-                results["keywords_found"].append(keyword)
-            else:
-                results["missing_keywords"].append(keyword)
+        # Tokenize once, then check keywords and achievement verbs by set lookup
+        text_lower = resume_text.lower()
+        found = set(_WORD_TOKEN_RE.findall(text_lower))
+        found.update(phrase for phrase, pattern in self._phrase_patterns if pattern.search(resume_text))
+        
+        results["keywords_found"] = [k for k in keywords if k.lower() in found]
+        results["missing_keywords"] = [k for k in keywords if k.lower() not in found]
+        results["keyword_count"] = len(results["keywords_found"])
         
         # Basic suggestions
-        if len(resume_text.split()) < 200:
+        # Only count as far as the threshold instead of splitting the whole text
+        if next(islice(_WORD_RE.finditer(resume_text), _MIN_RESUME_WORDS - 1, None), None) is None:
             results["suggestions"].append("Your resume seems short. Consider adding more details about your experience.")
         
-        if "objective" not in resume_text.lower() and "summary" not in resume_text.lower():
+        if "objective" not in text_lower and "summary" not in text_lower:
             results["suggestions"].append("Consider adding a career objective or professional summary.")
         
-        if not re.search(r'\b(achieved|accomplishment|improved|increased|decreased|reduced|saved|delivered)\b', resume_text, re.IGNORECASE):
+        # isdisjoint() stops at the first hit and builds no intermediate set
+        if found.isdisjoint(_ACHIEVEMENT_WORDS):
             results["suggestions"].append("Add more achievement-oriented language with measurable results.")
         
         # Calculate basic score
-        score = min(100, (results["keyword_count"] / len(keywords)) * 70 + 30)
-        results["score"] = round(score)
+        results["score"] = min(100, int(results["keyword_count"] * self._keyword_weight + 30.5))
         
         return results
     
     def get_interview_tips(self, job_title=""):
         """Get interview preparation tips, optionally tailored to a specific job."""
-        with open(os.path.join(self.resources_path, "interview_questions.json"), 'r') as f:
-            interview_data = json.load(f)
-            
+        interview_data = self._interview
+        
         tips = {
-            "common_questions": interview_data["common_questions"],
+            "common_questions": list(interview_data["common_questions"]),
             "preparation_tips": [
                 "Research the company thoroughly",
                 "Practice your answers out loud",
@@ -133,35 +205,25 @@ class CareerDevelopmentAgent:
             "technical_topics": []
         }
         
-        # Add relevant technical topics based on job title
-        job_title_lower = job_title.lower()
-        if "software" in job_title_lower or "developer" in job_title_lower or "engineer" in job_title_lower:
-            tips["technical_topics"] = interview_data["technical_topics"]["programming"]
-        elif "project" in job_title_lower or "manager" in job_title_lower:
-            tips["technical_topics"] = interview_data["technical_topics"]["project_management"]
-        elif "market" in job_title_lower:
-            tips["technical_topics"] = interview_data["technical_topics"]["marketing"]
+        # Add relevant technical topics based on job title, scanning the title once
+        matched = {_TITLE_FRAGMENT_TO_CATEGORY[m] for m in _TITLE_RE.findall(job_title.lower())}
+        for category, _ in _TITLE_CATEGORIES:
+            if category in matched:
+                tips["technical_topics"] = list(interview_data["technical_topics"][category])
+                break
         
         return tips
     
     def suggest_career_paths(self, interests, skills):
         """Suggest potential career paths based on interests and skills."""
-        with open(os.path.join(self.resources_path, "career_paths.json"), 'r') as f:
-            career_paths = json.load(f)
+        career_paths = self._career_paths
         
-        suggestions = []
-        interests_lower = [i.lower() for i in interests]
-        skills_lower = [s.lower() for s in skills]
+        terms = {term.lower() for term in chain(interests, skills)}
         
-        # Simple matching algorithm
-        if any(tech_term in interests_lower + skills_lower for tech_term in ["coding", "programming", "software", "computer", "technology", "data"]):
-            suggestions.extend(career_paths["tech"])
-            
-        if any(business_term in interests_lower + skills_lower for business_term in ["business", "finance", "management", "marketing", "sales"]):
-            suggestions.extend(career_paths["business"])
-            
-        if any(health_term in interests_lower + skills_lower for health_term in ["health", "medicine", "care", "patient", "biology"]):
-            suggestions.extend(career_paths["healthcare"])
+        # Simple matching algorithm: look up each term's category, emitting categories
+        # in the fixed tech, business, healthcare order
+        hits = {_TRIGGER_TO_CATEGORY[t] for t in terms if t in _TRIGGER_TO_CATEGORY}
+        suggestions = [career for category in _CATEGORY_TRIGGERS if category in hits for career in career_paths[category]]
         
         # If no matches, return a mix of options
         if not suggestions:
@@ -172,8 +234,7 @@ class CareerDevelopmentAgent:
     
     def generate_job_search_plan(self, job_title, location, experience_level):
         """Generate a personalized job search plan."""
-        with open(os.path.join(self.resources_path, "job_search_tips.json"), 'r') as f:
-            resources = json.load(f)
+        resources = self._job_search
         
         plan = {
             "daily_tasks": [
@@ -187,8 +248,8 @@ class CareerDevelopmentAgent:
                 "Update job search tracking document"
             ],
             "resources": {
-                "job_boards": resources["job_boards"],
-                "networking_opportunities": resources["networking_tips"]
+                "job_boards": list(resources["job_boards"]),
+                "networking_opportunities": list(resources["networking_tips"])
             },
             "timeline": {
                 "week1": "Research companies and update resume/LinkedIn",
@@ -226,6 +287,11 @@ class CareerAgentGUI:
         self.root.geometry("800x600")
         self.root.minsize(700, 500)
         
+        # Busy indicator shown while the agent works in the background
+        self.progress = ttk.Progressbar(self.root, mode='indeterminate')
+        self.progress.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 10))
+        self._pending_tasks = 0
+        
         # Create notebook (tabs)
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -243,12 +309,21 @@ class CareerAgentGUI:
         self.notebook.add(self.career_tab, text="Career Paths")
         self.notebook.add(self.job_search_tab, text="Job Search Plan")
         
-        # Set up each tab
+        # Set up the first tab now; the others are built the first time they are shown
         self.setup_profile_tab()
-        self.setup_resume_tab()
-        self.setup_interview_tab()
-        self.setup_career_tab()
-        self.setup_job_search_tab()
+        self._pending_tab_setup = {
+            str(self.resume_tab): self.setup_resume_tab,
+            str(self.interview_tab): self.setup_interview_tab,
+            str(self.career_tab): self.setup_career_tab,
+            str(self.job_search_tab): self.setup_job_search_tab
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+    
+    def _on_tab_changed(self, event):
+        """Build a tab's widgets the first time it is selected."""
+        setup = self._pending_tab_setup.pop(str(self.notebook.select()), None)
+        if setup is not None:
+            setup()
     
     def setup_profile_tab(self):
         """Set up the profile tab content."""
@@ -294,7 +369,8 @@ class CareerAgentGUI:
         self.analysis_results.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
         
         # Analyze button
-        ttk.Button(frame, text="Analyze Resume", command=self.analyze_resume).grid(row=5, column=0, pady=10)
+        self.analyze_button = ttk.Button(frame, text="Analyze Resume", command=self.analyze_resume)
+        self.analyze_button.grid(row=5, column=0, pady=10)
     
     def setup_interview_tab(self):
         """Set up the interview preparation tab content."""
@@ -309,7 +385,8 @@ class CareerAgentGUI:
         self.job_title_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Get tips button
-        ttk.Button(frame, text="Get Interview Tips", command=self.get_interview_tips).grid(row=2, column=0, pady=10)
+        self.interview_button = ttk.Button(frame, text="Get Interview Tips", command=self.get_interview_tips)
+        self.interview_button.grid(row=2, column=0, pady=10)
         
         # Tips display area
         self.interview_tips_display = scrolledtext.ScrolledText(frame, width=60, height=20, state='disabled')
@@ -333,7 +410,8 @@ class CareerAgentGUI:
         self.skills_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Get suggestions button
-        ttk.Button(frame, text="Get Career Suggestions", command=self.get_career_suggestions).grid(row=3, column=0, pady=10)
+        self.career_button = ttk.Button(frame, text="Get Career Suggestions", command=self.get_career_suggestions)
+        self.career_button.grid(row=3, column=0, pady=10)
         
         # Suggestions display area
         self.career_suggestions_display = scrolledtext.ScrolledText(frame, width=60, height=15, state='disabled')
@@ -365,7 +443,8 @@ class CareerAgentGUI:
         experience_combo.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Generate plan button
-        ttk.Button(frame, text="Generate Job Search Plan", command=self.generate_search_plan).grid(row=4, column=0, pady=10)
+        self.plan_button = ttk.Button(frame, text="Generate Job Search Plan", command=self.generate_search_plan)
+        self.plan_button.grid(row=4, column=0, pady=10)
         
         # Plan display area
         self.plan_display = scrolledtext.ScrolledText(frame, width=60, height=15, state='disabled')
@@ -379,7 +458,7 @@ class CareerAgentGUI:
             profile_data[key] = entry.get()
             
         # Add timestamp
-        profile_data["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        profile_data["last_updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
         
         # Update agent's profile
         for key, value in profile_data.items():
@@ -418,6 +497,52 @@ class CareerAgentGUI:
             else:
                 messagebox.showerror("Error", "Failed to load profile.")
     
+    def _show_text(self, widget, text):
+        """Replace the contents of a read-only text widget in a single Tk command."""
+        widget.config(state='normal')
+        # replace() deletes and inserts in one call, so the widget only re-lays out once
+        widget.replace("1.0", tk.END, text)
+        # Park the cursor at the top instead of tracking it to the end of the new text
+        widget.mark_set(tk.INSERT, "1.0")
+        widget.config(state='disabled')
+    
+    def _run_in_background(self, button, task, on_done):
+        """Run task on a worker thread and pass its result to on_done on the Tk thread."""
+        button.config(state='disabled')
+        self._pending_tasks += 1
+        if self._pending_tasks == 1:
+            self.progress.start(10)
+        
+        # Tk is not thread-safe, so the worker only hands its result over a queue
+        results = queue.Queue()
+        
+        def worker():
+            try:
+                results.put((True, task()))
+            except Exception as e:
+                results.put((False, e))
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(50, self._poll_background, results, button, on_done)
+    
+    def _poll_background(self, results, button, on_done):
+        """Deliver a finished background task's result, or check again shortly."""
+        try:
+            succeeded, value = results.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_background, results, button, on_done)
+            return
+        
+        self._pending_tasks -= 1
+        if not self._pending_tasks:
+            self.progress.stop()
+        button.config(state='normal')
+        
+        if succeeded:
+            on_done(value)
+        else:
+            messagebox.showerror("Error", f"Something went wrong: {value}")
+    
     def analyze_resume(self):
         """Analyze the resume text and display results."""
         resume_text = self.resume_text.get("1.0", tk.END)
@@ -426,58 +551,42 @@ class CareerAgentGUI:
             messagebox.showwarning("Warning", "Please enter a longer resume text for better analysis.")
             return
         
-        results = self.agent.analyze_resume(resume_text)
-        
-        # Display results
-        self.analysis_results.config(state='normal')
-        self.analysis_results.delete("1.0", tk.END)
-        
-        self.analysis_results.insert(tk.END, f"Resume Score: {results['score']}/100\n\n")
-        
-        self.analysis_results.insert(tk.END, "Keywords Found:\n")
-        for keyword in results["keywords_found"]:
-            self.analysis_results.insert(tk.END, f"✓ {keyword}\n")
+        self._run_in_background(self.analyze_button, lambda: self.agent.analyze_resume(resume_text), self._show_analysis)
+    
+    def _show_analysis(self, results):
+        """Display resume analysis results."""
+        parts = [f"Resume Score: {results['score']}/100\n\n", "Keywords Found:\n"]
+        parts.extend(f"✓ {keyword}\n" for keyword in results["keywords_found"])
         
-        self.analysis_results.insert(tk.END, "\nSuggested Keywords to Add:\n")
-        for keyword in results["missing_keywords"]:
-            self.analysis_results.insert(tk.END, f"- {keyword}\n")
+        parts.append("\nSuggested Keywords to Add:\n")
+        parts.extend(f"- {keyword}\n" for keyword in results["missing_keywords"])
         
-        self.analysis_results.insert(tk.END, "\nImprovement Suggestions:\n")
-        for suggestion in results["suggestions"]:
-            self.analysis_results.insert(tk.END, f"• {suggestion}\n")
+        parts.append("\nImprovement Suggestions:\n")
+        parts.extend(f"• {suggestion}\n" for suggestion in results["suggestions"])
         
-        self.analysis_results.config(state='disabled')
+        self._show_text(self.analysis_results, "".join(parts))
     
     def get_interview_tips(self):
         """Get and display interview preparation tips."""
         job_title = self.job_title_entry.get()
         
-        tips = self.agent.get_interview_tips(job_title)
-        
-        # Display tips
-        self.interview_tips_display.config(state='normal')
-        self.interview_tips_display.delete("1.0", tk.END)
-        
-        self.interview_tips_display.insert(tk.END, "COMMON INTERVIEW QUESTIONS\n")
-        self.interview_tips_display.insert(tk.END, "=========================\n\n")
-        
-        for i, question in enumerate(tips["common_questions"], 1):
-            self.interview_tips_display.insert(tk.END, f"{i}. {question}\n")
-        
-        self.interview_tips_display.insert(tk.END, "\n\nPREPARATION TIPS\n")
-        self.interview_tips_display.insert(tk.END, "===============\n\n")
+        self._run_in_background(self.interview_button, lambda: self.agent.get_interview_tips(job_title), self._show_interview_tips)
+    
+    def _show_interview_tips(self, tips):
+        """Display interview preparation tips."""
+        parts = ["COMMON INTERVIEW QUESTIONS\n", "=========================\n\n"]
+        parts.extend(f"{i}. {question}\n" for i, question in enumerate(tips["common_questions"], 1))
         
-        for i, tip in enumerate(tips["preparation_tips"], 1):
-            self.interview_tips_display.insert(tk.END, f"{i}. {tip}\n")
+        parts.append("\n\nPREPARATION TIPS\n")
+        parts.append("===============\n\n")
+        parts.extend(f"{i}. {tip}\n" for i, tip in enumerate(tips["preparation_tips"], 1))
         
         if tips["technical_topics"]:
-            self.interview_tips_display.insert(tk.END, "\n\nRELEVANT TECHNICAL TOPICS TO STUDY\n")
-            self.interview_tips_display.insert(tk.END, "===============================\n\n")
-            
-            for i, topic in enumerate(tips["technical_topics"], 1):
-                self.interview_tips_display.insert(tk.END, f"{i}. {topic}\n")
+            parts.append("\n\nRELEVANT TECHNICAL TOPICS TO STUDY\n")
+            parts.append("===============================\n\n")
+            parts.extend(f"{i}. {topic}\n" for i, topic in enumerate(tips["technical_topics"], 1))
         
-        self.interview_tips_display.config(state='disabled')
+        self._show_text(self.interview_tips_display, "".join(parts))
     
     def get_career_suggestions(self):
         """Get and display career path suggestions."""
@@ -488,29 +597,30 @@ class CareerAgentGUI:
             messagebox.showwarning("Warning", "Please enter both interests and skills.")
             return
         
-        interests = [i.strip() for i in interests_text.split(",")]
-        skills = [s.strip() for s in skills_text.split(",")]
-        
-        suggestions = self.agent.suggest_career_paths(interests, skills)
-        
-        # Display suggestions
-        self.career_suggestions_display.config(state='normal')
-        self.career_suggestions_display.delete("1.0", tk.END)
-        
-        self.career_suggestions_display.insert(tk.END, "SUGGESTED CAREER PATHS\n")
-        self.career_suggestions_display.insert(tk.END, "======================\n\n")
-        
-        self.career_suggestions_display.insert(tk.END, "Based on your interests and skills, you might consider:\n\n")
-        
-        for i, career in enumerate(suggestions, 1):
-            self.career_suggestions_display.insert(tk.END, f"{i}. {career}\n")
-        
-        self.career_suggestions_display.insert(tk.END, "\n\nNext Steps:\n")
-        self.career_suggestions_display.insert(tk.END, "1. Research these roles to learn more about daily responsibilities\n")
-        self.career_suggestions_display.insert(tk.END, "2. Identify any skill gaps and create a learning plan\n")
-        self.career_suggestions_display.insert(tk.END, "3. Connect with professionals in these fields for informational interviews\n")
+        interests = {m.group().lower() for m in _TERM_RE.finditer(interests_text)}
+        skills = {m.group().lower() for m in _TERM_RE.finditer(skills_text)}
         
-        self.career_suggestions_display.config(state='disabled')
+        self._run_in_background(
+            self.career_button,
+            lambda: self.agent.suggest_career_paths(interests, skills),
+            self._show_career_suggestions
+        )
+    
+    def _show_career_suggestions(self, suggestions):
+        """Display career path suggestions."""
+        parts = [
+            "SUGGESTED CAREER PATHS\n",
+            "======================\n\n",
+            "Based on your interests and skills, you might consider:\n\n"
+        ]
+        parts.extend(f"{i}. {career}\n" for i, career in enumerate(suggestions, 1))
+        
+        parts.append("\n\nNext Steps:\n")
+        parts.append("1. Research these roles to learn more about daily responsibilities\n")
+        parts.append("2. Identify any skill gaps and create a learning plan\n")
+        parts.append("3. Connect with professionals in these fields for informational interviews\n")
+        
+        self._show_text(self.career_suggestions_display, "".join(parts))
     
     def generate_search_plan(self):
         """Generate and display a job search plan."""
@@ -522,35 +632,33 @@ class CareerAgentGUI:
             messagebox.showwarning("Warning", "Please enter both job title and location.")
             return
         
-        plan = self.agent.generate_job_search_plan(job_title, location, experience)
-        
-        # Display plan
-        self.plan_display.config(state='normal')
-        self.plan_display.delete("1.0", tk.END)
-        
-        self.plan_display.insert(tk.END, f"JOB SEARCH PLAN: {job_title.upper()} IN {location.upper()}\n")
-        self.plan_display.insert(tk.END, "=" * 50 + "\n\n")
+        self._run_in_background(
+            self.plan_button,
+            lambda: self.agent.generate_job_search_plan(job_title, location, experience),
+            lambda plan: self._show_search_plan(plan, job_title, location)
+        )
+    
+    def _show_search_plan(self, plan, job_title, location):
+        """Display a generated job search plan."""
+        parts = [f"JOB SEARCH PLAN: {job_title.upper()} IN {location.upper()}\n", "=" * 50 + "\n\n"]
         
-        self.plan_display.insert(tk.END, "DAILY TASKS:\n")
-        for task in plan["daily_tasks"]:
-            self.plan_display.insert(tk.END, f"• {task}\n")
+        parts.append("DAILY TASKS:\n")
+        parts.extend(f"• {task}\n" for task in plan["daily_tasks"])
         
-        self.plan_display.insert(tk.END, "\nWEEKLY TASKS:\n")
-        for task in plan["weekly_tasks"]:
-            self.plan_display.insert(tk.END, f"• {task}\n")
+        parts.append("\nWEEKLY TASKS:\n")
+        parts.extend(f"• {task}\n" for task in plan["weekly_tasks"])
         
-        self.plan_display.insert(tk.END, "\nRECOMMENDED RESOURCES:\n")
-        self.plan_display.insert(tk.END, "- Job Boards: " + ", ".join(plan["resources"]["job_boards"][:4]) + "\n")
-        self.plan_display.insert(tk.END, "- Networking: " + ", ".join(plan["resources"]["networking_opportunities"][:3]) + "\n")
+        parts.append("\nRECOMMENDED RESOURCES:\n")
+        parts.append("- Job Boards: " + ", ".join(plan["resources"]["job_boards"][:4]) + "\n")
+        parts.append("- Networking: " + ", ".join(plan["resources"]["networking_opportunities"][:3]) + "\n")
         
         if "additional" in plan["resources"]:
-            self.plan_display.insert(tk.END, "- Additional: " + ", ".join(plan["resources"]["additional"]) + "\n")
+            parts.append("- Additional: " + ", ".join(plan["resources"]["additional"]) + "\n")
         
-        self.plan_display.insert(tk.END, "\nTIMELINE:\n")
-        for week, activity in plan["timeline"].items():
-            self.plan_display.insert(tk.END, f"- {week.capitalize()}: {activity}\n")
+        parts.append("\nTIMELINE:\n")
+        parts.extend(f"- {week.capitalize()}: {activity}\n" for week, activity in plan["timeline"].items())
         
-        self.plan_display.config(state='disabled')
+        self._show_text(self.plan_display, "".join(parts))
 
 
 def main():